@@ -62,10 +62,8 @@ def topology_plugin(lkp: util.Lookup) -> str:
     """
     Returns configured topology plugin, defaults to `topology/tree`.
     """
-    cp, key = lkp.cfg.cloud_parameters, "topology_plugin"
-    if key not in cp or cp[key] is None:
-        return TOPOLOGY_TREE
-    return cp[key]
+    plugin = lkp.cfg.cloud_parameters.get("topology_plugin")
+    return TOPOLOGY_TREE if plugin is None else plugin
 
 class SlurmConfigGenerator:
     """Base Slurm configuration generator. Represents Slurm 25.05 baseline."""
@@ -106,13 +104,13 @@ class SlurmConfigGenerator:
             """
             Returns the value of the key in params if it exists and is not None,
             otherwise returns supplied default.
-            We can't rely on the `dict.get` method because the value could be `None` as
-            well as empty NSDict, depending on type of the `cfg.cloud_parameters`.
+            We can't rely on `dict.get(key, default)` because the key could be present
+            with a `None` value. Uses `dict.get` rather than attribute access so NSDict
+            never auto-creates missing keys.
             TODO: Simplify once NSDict is removed from the codebase.
             """
-            if key not in params or params[key] is None:
-                return default
-            return params[key]
+            value = params.get(key)
+            return default if value is None else value
 
         no_comma_params = get("no_comma_params", False)
 
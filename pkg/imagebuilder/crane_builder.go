@@ -16,7 +16,6 @@ package imagebuilder
 
 import (
 	"archive/tar"
-	"compress/gzip"
 	"fmt"
 	"io"
 	"io/fs"
@@ -35,6 +34,7 @@ import (
 	v1 "github.com/google/go-containerregistry/pkg/v1"
 	"github.com/google/go-containerregistry/pkg/v1/mutate"
 	"github.com/google/go-containerregistry/pkg/v1/tarball"
+	"github.com/klauspost/compress/gzip"
 	"github.com/moby/patternmatcher"
 	"github.com/moby/patternmatcher/ignorefile"
 )
@@ -81,16 +81,29 @@ func BuildContainerImageFromBaseImage(
 	logging.Info("Target Platform: %s/%s", platform.OS, platform.Architecture)
 
 	// Create a tarball in a temporary file from the scriptDir, applying ignore patterns.
-	tempTarballPath, err := createFilteredTar(scriptDir, ignoreMatcher)
-	if err != nil {
-		return "", fmt.Errorf("failed to create filtered tarball: %w", err)
-	}
+	// This runs while the base image is being resolved, since the two are independent.
+	tarDone := make(chan tarResult, 1)
+	go func() {
+		path, tarErr := createFilteredTar(scriptDir, ignoreMatcher)
+		tarDone <- tarResult{path: path, err: tarErr}
+	}()
+
+	baseImg, pullErr := pullBaseImage(baseImage, platform)
+
+	tarRes := <-tarDone
+	tempTarballPath := tarRes.path
 	// Ensure the temporary file is cleaned up after use.
 	defer func() {
 		if tempTarballPath != "" {
 			os.Remove(tempTarballPath)
 		}
 	}()
+	if tarRes.err != nil {
+		return "", fmt.Errorf("failed to create filtered tarball: %w", tarRes.err)
+	}
+	if pullErr != nil {
+		return "", pullErr
+	}
 
 	// Create a v1.Layer from the tarball.
 	tarLayer, err := layerFromOpener(func() (io.ReadCloser, error) {
@@ -104,16 +117,6 @@ func BuildContainerImageFromBaseImage(
 		return "", fmt.Errorf("failed to create layer from tarball: %w", err)
 	}
 
-	baseRef, err := name.ParseReference(baseImage)
-	if err != nil {
-		return "", fmt.Errorf("failed to parse base image reference %q: %w", baseImage, err)
-	}
-
-	baseImg, err := cranePull(baseRef.String(), crane.WithPlatform(&platform))
-	if err != nil {
-		return "", fmt.Errorf("failed to pull base image %q: %w", baseImage, err)
-	}
-
 	newImg, err := appendLayers(baseImg, tarLayer)
 	if err != nil {
 		return "", fmt.Errorf("failed to append layer: %w", err)
@@ -136,6 +139,26 @@ func BuildContainerImageFromBaseImage(
 	return imageName, nil
 }
 
+// tarResult carries the outcome of createFilteredTar back from its goroutine.
+type tarResult struct {
+	path string
+	err  error
+}
+
+// pullBaseImage resolves baseImage for the given platform.
+func pullBaseImage(baseImage string, platform v1.Platform) (v1.Image, error) {
+	baseRef, err := name.ParseReference(baseImage)
+	if err != nil {
+		return nil, fmt.Errorf("failed to parse base image reference %q: %w", baseImage, err)
+	}
+
+	baseImg, err := cranePull(baseRef.String(), crane.WithPlatform(&platform))
+	if err != nil {
+		return nil, fmt.Errorf("failed to pull base image %q: %w", baseImage, err)
+	}
+	return baseImg, nil
+}
+
 func GenerateImageName(project, location string) (string, error) {
 	userName := os.Getenv("USER")
 	if userName == "" {
@@ -163,13 +186,13 @@ func GenerateImageName(project, location string) (string, error) {
 
 // parsePlatform converts a platform string (e.g., "linux/amd64") into a v1.Platform struct.
 func parsePlatform(platformStr string) (v1.Platform, error) {
-	parts := strings.Split(platformStr, "/")
-	if len(parts) != 2 {
+	osName, arch, found := strings.Cut(platformStr, "/")
+	if !found || strings.Contains(arch, "/") {
 		return v1.Platform{}, fmt.Errorf("invalid platform format: %q, expected \"os/arch\"", platformStr)
 	}
 	return v1.Platform{
-		OS:           parts[0],
-		Architecture: parts[1],
+		OS:           osName,
+		Architecture: arch,
 	}, nil
 }
 
@@ -286,7 +309,6 @@ func createFilteredTar(sourceDir string, ignoreMatcher *patternmatcher.PatternMa
 	if tmpErr != nil {
 		return "", fmt.Errorf("failed to create temporary file for tarball: %w", tmpErr)
 	}
-	defer tmpFile.Close()
 
 	gzipWriter := gzip.NewWriter(tmpFile)
 	tarWriter := tar.NewWriter(gzipWriter)
@@ -301,6 +323,14 @@ func createFilteredTar(sourceDir string, ignoreMatcher *patternmatcher.PatternMa
 		if closeErr := gzipWriter.Close(); closeErr != nil && err == nil {
 			err = fmt.Errorf("failed to close gzip writer: %w", closeErr)
 		}
+		if closeErr := tmpFile.Close(); closeErr != nil && err == nil {
+			err = fmt.Errorf("failed to close temporary tarball %q: %w", tmpFile.Name(), closeErr)
+		}
+		// Never hand back a partially written tarball
+		if err != nil {
+			os.Remove(tmpFile.Name())
+			tarPath = ""
+		}
 	}()
 
 	err = filepath.WalkDir(sourceDir, func(path string, d fs.DirEntry, walkDirErr error) error {
@@ -308,7 +338,6 @@ func createFilteredTar(sourceDir string, ignoreMatcher *patternmatcher.PatternMa
 	})
 
 	if err != nil {
-		os.Remove(tmpFile.Name())
 		return "", err
 	}
 
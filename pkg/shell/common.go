@@ -20,6 +20,7 @@ import (
 	"bufio"
 	"bytes"
 	"crypto/rand"
+	"encoding/hex"
 	"fmt"
 	"hpc-toolkit/pkg/config"
 	"hpc-toolkit/pkg/logging"
@@ -106,7 +107,7 @@ func RandomString(length int) (string, error) {
 	if _, err := rand.Read(b); err != nil {
 		return "", fmt.Errorf("failed to generate random string: %w", err)
 	}
-	return fmt.Sprintf("%x", b)[:length], nil
+	return hex.EncodeToString(b)[:length], nil
 }
 
 // ValidateDeploymentDirectory ensures that the deployment directory structure